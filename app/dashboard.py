@@ -12,6 +12,10 @@ Run locally:
 
 from __future__ import annotations
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
 from scripts import fetch_data, analyzer, visualizer
@@ -41,27 +45,88 @@ auto_refresh = st.sidebar.checkbox("Auto‑refresh every 60 s", value=False)
 refresh_button = st.sidebar.button("🔄 Manual Refresh")
 
 REFRESH_INTERVAL = 60  # seconds
+TOP_N_BAR = 10  # pools in the volume bar chart
+TOP_N_BUBBLE = 25  # pools in the TVL vs volume bubble chart
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Data fetching (cached)
 # ───────────────────────────────────────────────────────────────────────────────
 
 @st.cache_data(ttl=REFRESH_INTERVAL, show_spinner="Fetching pools …")
-def get_data(net: str, lim: int) -> pd.DataFrame:
-    pools = fetch_data.get_pools(net, limit=lim)
+def get_chart_data(net: str, lim: int) -> dict[str, pd.DataFrame]:
+    """Fetch and clean pools, pre‑slicing the subsets each chart needs."""
+    pools = fetch_data.get_pools_paged(net, total=lim)
     df_raw = fetch_data.pools_to_dataframe(pools)
     df_clean = analyzer.clean_numeric(df_raw, [
         "tvl_usd",
         "volume_usd_24h",
         "price_change_percentage_24h",
     ])
-    return df_clean
+    return {
+        "bar_df": df_clean.nlargest(TOP_N_BAR, "volume_usd_24h"),
+        "bubble_df": df_clean.nlargest(TOP_N_BUBBLE, "tvl_usd"),
+        "raw": df_clean,
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def prefetch_executor() -> ThreadPoolExecutor:
+    """Process‑wide pool used to warm the API cache for other networks."""
+    return ThreadPoolExecutor(max_workers=len(NETWORKS))
+
+
+def _frame_key(df: pd.DataFrame) -> tuple[tuple[str, ...], int]:
+    """Small hashable stand‑in for *df* used as a figure cache key."""
+    return (
+        tuple(df["pool_id"].tolist()),
+        int(pd.util.hash_pandas_object(df, index=False).sum()),
+    )
+
+
+@st.cache_data(ttl=REFRESH_INTERVAL, show_spinner=False)
+def build_bar_json(_df: pd.DataFrame, df_key: tuple, n: int) -> str:
+    """Serialized bar chart; *_df* is not hashed, *df_key* identifies it."""
+    return visualizer.bar_top_volume(_df, n=n).to_json()
+
+
+@st.cache_data(ttl=REFRESH_INTERVAL, show_spinner=False)
+def build_bubble_json(_df: pd.DataFrame, df_key: tuple, n: int) -> str:
+    """Serialized bubble chart; *_df* is not hashed, *df_key* identifies it."""
+    return visualizer.bubble_tvl_vs_volume(_df, n=n).to_json()
 
 # Trigger refresh logic
 if refresh_button or (auto_refresh and st.session_state.get("auto_update", False)):
-    st.cache_data.clear()
-
-df = get_data(network, limit)
+    get_chart_data.clear()  # only invalidate pool data, keep other cached results
+    fetch_data.clear_cache()
+    st.session_state.pop("data_key", None)
+
+# Reuse this session's frames while network/limit are unchanged and fresh,
+# skipping st.cache_data's per-rerun copy of the stored result
+data_key = (network, limit)
+stale = time.time() - st.session_state.get("data_ts", 0.0) > REFRESH_INTERVAL
+if st.session_state.get("data_key") != data_key or stale:
+    st.session_state["data"] = get_chart_data(network, limit)
+    st.session_state["data_key"] = data_key
+    st.session_state["data_ts"] = time.time()
+    st.session_state["data_misses"] = st.session_state.get("data_misses", 0) + 1
+else:
+    st.session_state["data_hits"] = st.session_state.get("data_hits", 0) + 1
+data = st.session_state["data"]
+
+# Once per session, fetch the other networks in the background so switching
+# networks is served from fetch_data's on-disk cache instead of the API
+if not st.session_state.get("warmed"):
+    executor = prefetch_executor()
+    for net in NETWORKS.values():
+        if net != network:
+            executor.submit(fetch_data.get_pools_paged, net, limit)
+    st.session_state["warmed"] = True
+
+st.sidebar.metric(
+    "Session cache hits",
+    st.session_state.get("data_hits", 0),
+    help=f"Misses: {st.session_state.get('data_misses', 0)}",
+)
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Main dashboard
@@ -70,17 +135,20 @@ st.title(f"DeX‑Ray 📊 – {network_name} Pools")
 
 # Top volume bar chart
 st.subheader("Top Pools by 24‑Hour Volume (USD)")
-fig_bar = visualizer.bar_top_volume(df, n=10)
-st.plotly_chart(fig_bar, use_container_width=True)
+bar_df = data["bar_df"]
+fig_bar = build_bar_json(bar_df, _frame_key(bar_df), TOP_N_BAR)
+st.plotly_chart(json.loads(fig_bar), use_container_width=True)
 
 # Bubble chart TVL vs volume
 st.subheader("TVL vs 24‑Hour Volume (Bubble Size = Price % Change)")
-fig_bubble = visualizer.bubble_tvl_vs_volume(df)
-st.plotly_chart(fig_bubble, use_container_width=True)
+bubble_df = data["bubble_df"]
+fig_bubble = build_bubble_json(bubble_df, _frame_key(bubble_df), TOP_N_BUBBLE)
+st.plotly_chart(json.loads(fig_bubble), use_container_width=True)
 
-# Raw data expander
+# Raw data expander – full frame only shipped to the browser on demand
 with st.expander("Raw Data Table"):
-    st.dataframe(df, use_container_width=True)
+    if st.toggle("Show raw"):
+        st.dataframe(data["raw"], use_container_width=True)
 
 # Footer
 st.caption("Built with ❤️ using GeckoTerminal DEX API · DeX‑Ray © 2025")
@@ -7,10 +7,6 @@ can simply write:
     from scripts import fetch_data, analyzer, visualizer
 """
 
-# ---- public re-exports -----------------------------------------------------
-# Re-export core helper modules so callers can use:
-#     from scripts import fetch_data, analyzer, visualizer
 from . import fetch_data, analyzer, visualizer
 
 __all__: list[str] = ["fetch_data", "analyzer", "visualizer"]
-# ---------------------------------------------------------------------------
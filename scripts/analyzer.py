@@ -7,7 +7,7 @@ Transforms raw DataFrames from `fetch_data.py` into meaningful, presentation‑r
 Functions
 ---------
 clean_numeric(df: DataFrame, cols: list[str]) -> DataFrame
-    Converts string‑numeric columns (e.g. 'tvl_usd') to floats.
+    Converts string‑numeric columns (e.g. 'tvl_usd') to Arrow float32.
 
 top_pools_by_volume(df: DataFrame, n: int = 10) -> DataFrame
     Returns top‑N pools ranked by 24‑hour volume.
@@ -26,18 +26,32 @@ $ python scripts/analyzer.py
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+try:
+    import bottleneck as bn  # C moving-window kernels
+except ImportError:  # pragma: no cover – optional, pandas rolling is used instead
+    bn = None
+
 # ---------------------------------------------------------------------------
 # Core helpers
 # ---------------------------------------------------------------------------
 
 def clean_numeric(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
-    """Ensure columns are numeric (remove commas / None → NaN)."""
+    """Ensure columns are numeric (remove commas / None → NaN).
+
+    Columns are downcast to (Arrow‑backed) float32 where possible and a
+    copy is returned, so the caller's DataFrame is left untouched. Columns
+    that are already numeric are passed through as‑is.
+    """
+    df = df.copy()
     for col in cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(
+                df[col], errors="coerce", downcast="float", dtype_backend="pyarrow"
+            )
     return df
 
 
@@ -45,11 +59,7 @@ def top_pools_by_volume(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
     """Return top‑N pools sorted by 24‑hour volume (descending)."""
     if "volume_usd_24h" not in df.columns:
         raise KeyError("DataFrame must contain 'volume_usd_24h' column")
-    return (
-        df.sort_values("volume_usd_24h", ascending=False)
-          .head(n)
-          .reset_index(drop=True)
-    )
+    return df.nlargest(n, "volume_usd_24h").reset_index(drop=True)
 
 
 def liquidity_vs_volume(df: pd.DataFrame) -> pd.DataFrame:
@@ -62,9 +72,21 @@ def liquidity_vs_volume(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def volatility(price_series: pd.Series, window: int = 24) -> pd.Series:
-    """Return rolling standard deviation (volatility) of price series."""
+    """Return rolling standard deviation (volatility) of price series.
+
+    Uses ``bottleneck.move_std`` when available; results match pandas'
+    ``rolling(window).std()`` (sample std, full window required).
+    """
     if price_series.empty:
         return pd.Series(dtype=float)
+    # move_std rejects windows longer than the series; pandas returns all-NaN
+    if bn is not None and window <= len(price_series):
+        values = price_series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return pd.Series(
+            bn.move_std(values, window, min_count=window, ddof=1),
+            index=price_series.index,
+            name=price_series.name,
+        )
     return price_series.astype(float).rolling(window=window).std()
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,78 @@
+"""
+cache.py
+
+Part of the **DeX‑Ray** project.
+Tiny file‑backed JSON cache used by `fetch_data.py` to skip GeckoTerminal
+round‑trips when a fresh response is already on disk.
+
+Classes
+-------
+FileCache(root: Path | str = ".cache", ttl: float = 60)
+    Stores one JSON file per (endpoint, params) pair and treats it as stale
+    once its mtime is older than *ttl* seconds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent / ".cache"
+DEFAULT_TTL = 60  # seconds – matches the dashboard's REFRESH_INTERVAL
+
+
+class FileCache:
+    """Mtime‑based TTL cache for JSON API responses."""
+
+    def __init__(self, root: Path | str = DEFAULT_ROOT, ttl: float = DEFAULT_TTL):
+        self.root = Path(root)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(endpoint: str, params: dict | None = None) -> str:
+        """Return a stable hash for *endpoint* + *params*."""
+        items = sorted((params or {}).items())
+        return hashlib.md5(f"{endpoint}{items}".encode()).hexdigest()
+
+    def path(self, endpoint: str, params: dict | None = None) -> Path:
+        """Return the on‑disk location for a cached response."""
+        return self.root / f"{self.key(endpoint, params)}.json"
+
+    def get(self, endpoint: str, params: dict | None = None) -> Any | None:
+        """Return the cached payload, or ``None`` if missing / expired."""
+        path = self.path(endpoint, params)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with path.open() as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, endpoint: str, params: dict | None, payload: Any) -> None:
+        """Write *payload* to disk; failures are ignored (cache is best‑effort)."""
+        path = self.path(endpoint, params)
+        tmp = None
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            # Unique temp file per writer, so concurrent sets never share one
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.root, suffix=".tmp", delete=False
+            ) as fp:
+                tmp = Path(fp.name)
+                json.dump(payload, fp)
+            os.replace(tmp, path)
+        except (OSError, TypeError):
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove every cached response and any leftover temp files."""
+        for pattern in ("*.json", "*.tmp"):
+            for path in self.root.glob(pattern):
+                path.unlink(missing_ok=True)
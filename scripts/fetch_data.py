@@ -7,9 +7,15 @@ Functions
 get_pools(network: str, limit: int = 100, page: int = 1) -> list[dict]
     Fetch a page of pools on a specified EVM network.
 
+get_pools_paged(network: str, total: int, page_size: int = PAGE_SIZE) -> list[dict]
+    Fetch *total* pools, requesting the required pages concurrently.
+
 get_pool(pool_id: str) -> dict
     Fetch detailed info for a single pool.
 
+clear_cache() -> None
+    Drop every on‑disk cached API response.
+
 pools_to_dataframe(pools: list[dict]) -> pandas.DataFrame
     Convert list of pool dicts to a DataFrame with curated columns.
 
@@ -24,8 +30,27 @@ Example
 from __future__ import annotations
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as _json  # Rust JSON parser; noticeably faster on large pages
+except ImportError:  # pragma: no cover – optional speed‑up
+    import json as _json
+
+try:
+    import ijson  # incremental parser for large list responses
+except ImportError:  # pragma: no cover – optional, falls back to full decode
+    ijson = None
+
+try:
+    from .cache import FileCache
+except ImportError:  # executed as a script, e.g. `python scripts/fetch_data.py`
+    from cache import FileCache
 
 BASE_URL = "https://api.geckoterminal.com/api/v2"
 
@@ -33,22 +58,105 @@ HEADERS = {
     "User-Agent": "DeX-Ray/1.0 (+https://github.com/yourusername/dex-ray-analytics)"
 }
 
-def _request(endpoint: str, params: dict | None = None) -> Dict[str, Any]:
+# Shared session: keeps TCP/TLS connections alive across calls (and threads)
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+
+PAGE_SIZE = 100  # pools requested per page by get_pools_paged
+MAX_WORKERS = 4  # concurrent page requests
+
+# On-disk response cache; TTL matches the dashboard's refresh interval
+_CACHE = FileCache()
+
+# Flattened API field -> curated DataFrame column
+_POOL_FIELDS = {
+    "id": "pool_id",
+    "attributes_token_a_symbol": "token_a_symbol",
+    "attributes_token_b_symbol": "token_b_symbol",
+    "attributes_dex_name": "dex_name",
+    "attributes_network": "network",
+    "attributes_price_usd": "price_usd",
+    "attributes_volume_usd_24h": "volume_usd_24h",
+    "attributes_volume_usd_7d": "volume_usd_7d",
+    "attributes_reserve_usd": "tvl_usd",
+    # percentage price change over 24h
+    "attributes_price_percent_change_24h": "price_change_pct_24h",
+}
+
+NUMERIC_COLS = [
+    "price_usd",
+    "volume_usd_24h",
+    "volume_usd_7d",
+    "tvl_usd",
+    "price_change_pct_24h",
+]
+
+# Low-cardinality labels stored as pandas categoricals
+CATEGORICAL_COLS = ["pair", "dex_name", "network"]
+
+_COLUMN_ORDER = ["pool_id", "pair", "dex_name", "network", *NUMERIC_COLS]
+
+_DECODE_ERRORS = (ValueError, ijson.JSONError) if ijson else (ValueError,)
+
+def _request(
+    endpoint: str,
+    params: dict | None = None,
+    stream: bool = False,
+) -> Dict[str, Any]:
     """Internal helper to perform a GET request and return JSON.
 
+    Responses are served from the on‑disk cache while still fresh. With
+    *stream* (list endpoints only) the ``data`` array is parsed item by item
+    with ijson while the body downloads, and returned as ``{"data": [...]}``.
+    Reading ``response.raw`` bypasses requests' exception mapping, so urllib3
+    errors (connection reset, read timeout, bad gzip) are caught directly.
+
     Raises
     ------
     RuntimeError
         If request fails or returns non‑200 status.
     """
+    params = params or {}
+    cached = _CACHE.get(endpoint, params)
+    if cached is not None:
+        return cached
+
     url = f"{BASE_URL}/{endpoint.lstrip('/')}"
     try:
-        response = requests.get(url, params=params or {}, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as exc:
+        if stream and ijson is not None:
+            with _SESSION.get(url, params=params, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True  # let urllib3 un‑gzip
+                items = ijson.items(response.raw, "data.item", use_float=True)
+                data = {"data": list(items)}
+        else:
+            response = _SESSION.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            data = _json.loads(response.content)
+    except (requests.RequestException, Urllib3HTTPError, *_DECODE_ERRORS) as exc:
         raise RuntimeError(f"API request failed: {exc}") from exc
 
+    _CACHE.set(endpoint, params, data)
+    return data
+
+
+def clear_cache() -> None:
+    """Remove all cached API responses so the next call hits the network."""
+    _CACHE.clear()
+
 
 def get_pools(network: str, limit: int = 100, page: int = 1) -> List[Dict[str, Any]]:
     """Fetch a list of pools for a given network.
@@ -69,10 +177,45 @@ def get_pools(network: str, limit: int = 100, page: int = 1) -> List[Dict[str, A
     """
     endpoint = f"networks/{network}/pools"
     params = {"page[number]": page, "page[size]": limit}
-    data = _request(endpoint, params)
+    data = _request(endpoint, params, stream=True)
     return data.get("data", [])
 
 
+def get_pools_paged(
+    network: str,
+    total: int,
+    page_size: int = PAGE_SIZE,
+) -> List[Dict[str, Any]]:
+    """Fetch *total* pools, issuing the page requests concurrently.
+
+    Parameters
+    ----------
+    network : str
+        Network slug, e.g. 'ethereum', 'bsc', 'arbitrum'.
+    total : int
+        Number of pools wanted across all pages.
+    page_size : int, default PAGE_SIZE
+        Number of pools per page request.
+
+    Returns
+    -------
+    list[dict]
+        Raw pool objects from API, in page order.
+    """
+    if total <= page_size:
+        return get_pools(network, limit=total)
+
+    n_pages = -(-total // page_size)
+    with ThreadPoolExecutor(max_workers=min(n_pages, MAX_WORKERS)) as pool:
+        pages = list(
+            pool.map(
+                lambda page: get_pools(network, limit=page_size, page=page),
+                range(1, n_pages + 1),
+            )
+        )
+    return [item for page in pages for item in page][:total]
+
+
 def get_pool(pool_id: str) -> Dict[str, Any]:
     """Fetch detailed data for a single pool.
 
@@ -94,7 +237,8 @@ def get_pool(pool_id: str) -> Dict[str, Any]:
 def pools_to_dataframe(pools: List[Dict[str, Any]]) -> pd.DataFrame:
     """Convert a list of pool dicts to a pandas DataFrame.
 
-    Extracts commonly used attributes for quick analysis.
+    Extracts commonly used attributes for quick analysis. Columns use
+    PyArrow‑backed dtypes; labels are categorical.
 
     Parameters
     ----------
@@ -105,36 +249,18 @@ def pools_to_dataframe(pools: List[Dict[str, Any]]) -> pd.DataFrame:
     -------
     pandas.DataFrame
     """
-    records = []
-    for item in pools:
-        attrs = item.get("attributes", {})
-        token_a = attrs.get("token_a_symbol")
-        token_b = attrs.get("token_b_symbol")
-        records.append(
-            {
-                "pool_id": item.get("id"),
-                "pair": f"{token_a}/{token_b}",
-                "dex_name": attrs.get("dex_name"),
-                "network": attrs.get("network"),
-                "price_usd": _f(attrs.get("price_usd")),
-                "volume_usd_24h": _f(attrs.get("volume_usd_24h")),
-                "volume_usd_7d": _f(attrs.get("volume_usd_7d")),
-                "tvl_usd": _f(attrs.get("reserve_usd")),
-                # percentage price change over 24h
-                "price_change_pct_24h": _f(
-                    attrs.get("price_percent_change_24h")
-                ),
-            }
-        )
-    return pd.DataFrame(records)
-
-
-def _f(value: Any) -> float | None:
-    """Safe float conversion."""
-    try:
-        return float(value) if value is not None else None
-    except (TypeError, ValueError):
-        return None
+    df = pd.json_normalize(pools, sep="_")
+    df = df.reindex(columns=list(_POOL_FIELDS)).rename(columns=_POOL_FIELDS)
+    for col in NUMERIC_COLS:
+        df[col] = pd.to_numeric(df[col], errors="coerce", downcast="float")
+    tokens = df[["token_a_symbol", "token_b_symbol"]].astype("string").fillna("?")
+    df["pair"] = tokens["token_a_symbol"].str.cat(tokens["token_b_symbol"], sep="/")
+    for col in CATEGORICAL_COLS:
+        df[col] = df[col].astype("category")
+    # Arrow-backed columns; keep whole-number floats as floats
+    return df[_COLUMN_ORDER].convert_dtypes(
+        dtype_backend="pyarrow", convert_integer=False
+    )
 
 
 if __name__ == "__main__":
@@ -11,7 +11,8 @@ bar_top_volume(df: pandas.DataFrame, n: int = 10) -> plotly.graph_objects.Figure
     Bar chart of the top‑N pools ranked by 24‑hour USD volume.
 
 line_price_trend(price_df: pandas.DataFrame, token_symbol: str = "", title: str | None = None)
-    Line chart of a token's USD price over time.
+    Line chart of a token's USD price over time. Long series are downsampled
+    with plotly‑resampler when it is installed.
 
 bubble_tvl_vs_volume(df: pandas.DataFrame, n: int = 25, title: str = "TVL vs 24H Volume")
     Bubble scatter where X = TVL, Y = 24H volume, bubble size & color = 24‑hour % price change.
@@ -24,34 +25,70 @@ cleans them, and displays a bar chart of the top‑5 by 24‑hour volume.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+# Price series longer than this are shown through FigureResampler
+RESAMPLE_THRESHOLD = 1000
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+def _usd_label(mult: int, decade: int) -> str:
+    """Format ``mult * 10**decade`` compactly, e.g. (2, 5) -> '200K'."""
+    for exp, suffix in ((12, "T"), (9, "B"), (6, "M"), (3, "K"), (0, "")):
+        if decade >= exp:
+            return f"{mult * 10 ** (decade - exp)}{suffix}"
+    return f"{mult * 10.0 ** decade:g}"
+
+
+def _log_ticks(values: pd.Series) -> tuple[list[float], list[str]]:
+    """Return tick positions and readable labels for log10 *values*.
+
+    Ticks sit on whole decades; when fewer than two of them fall inside the
+    data range, 1‑2‑5 (then 1…9) steps per decade are used instead so the
+    axis always carries labels.
+    """
+    values = values.dropna()
+    if values.empty:
+        return [], []
+    lo, hi = values.min(), values.max()
+    decades = range(int(np.floor(lo)), int(np.ceil(hi)) + 1)
+    for mults in ((1,), (1, 2, 5), tuple(range(1, 10))):
+        ticks = [(d + float(np.log10(m)), m, d) for d in decades for m in mults]
+        if sum(lo - 1e-9 <= t <= hi + 1e-9 for t, _, _ in ticks) >= 2:
+            break
+    return [t for t, _, _ in ticks], [_usd_label(m, d) for _, m, d in ticks]
+
 # -----------------------------------------------------------------------------
 # Chart builders
 # -----------------------------------------------------------------------------
 
 def bar_top_volume(df: pd.DataFrame, n: int = 10):
     """Return a Plotly bar chart of the top‑N pools by 24‑hour volume."""
-    top = (
-        df.sort_values("volume_usd_24h", ascending=False)
-        .head(n)
-        .copy()
+    top = df.nlargest(n, "volume_usd_24h")
+    fig = go.Figure(
+        go.Bar(
+            x=top["pair"].to_numpy(),
+            y=top["volume_usd_24h"].to_numpy(),
+            text=top["tvl_usd"].to_numpy(),
+            texttemplate="%{text:,.0f}",
+            hovertemplate=(
+                "Pool=%{x}<br>"
+                "24‑Hour Volume (USD)=%{y:,.0f}<br>"
+                "TVL (USD)=%{text:,.0f}<extra></extra>"
+            ),
+        )
     )
-    fig = px.bar(
-        top,
-        x="pair",
-        y="volume_usd_24h",
-        text="tvl_usd",
-        labels={
-            "pair": "Pool",
-            "volume_usd_24h": "24‑Hour Volume (USD)",
-            "tvl_usd": "TVL (USD)"
-        },
+    fig.update_layout(
         title=f"Top {n} Pools by 24‑Hour Volume",
+        xaxis_tickangle=-35,
+        xaxis_title="Pool (Token0‑Token1)",
+        yaxis_title="24‑Hour Volume (USD)",
     )
-    fig.update_layout(xaxis_tickangle=-35, xaxis_title="Pool (Token0‑Token1)")
     return fig
 
 
@@ -60,18 +97,34 @@ def line_price_trend(
     token_symbol: str = "",
     title: str | None = None,
 ):
-    """Plot a line chart of *token_symbol* price over time."""
+    """Plot a line chart of *token_symbol* price over time.
+
+    Series longer than ``RESAMPLE_THRESHOLD`` are wrapped in a
+    ``FigureResampler`` (if available) so only ~1000 points are shipped.
+    """
     if title is None:
         title = f"{token_symbol.upper()} Price Trend"
 
-    fig = go.Figure(
-        go.Scatter(
-            x=price_df["timestamp"],
-            y=price_df["price_usd"],
-            mode="lines",
-            name=token_symbol.upper(),
-        )
-    )
+    trace = go.Scattergl(mode="lines", name=token_symbol.upper())
+    fig = None
+    if len(price_df) > RESAMPLE_THRESHOLD:
+        # Imported lazily: plotly-resampler pulls in Dash, which is slow to load
+        try:
+            from plotly_resampler import FigureResampler
+        except ImportError:  # optional – long price series are then plotted in full
+            pass
+        else:
+            fig = FigureResampler(
+                go.Figure(), default_n_shown_samples=RESAMPLE_THRESHOLD
+            )
+            fig.add_trace(
+                trace,
+                hf_x=price_df["timestamp"].to_numpy(),
+                hf_y=price_df["price_usd"].to_numpy(),
+            )
+    if fig is None:
+        trace.update(x=price_df["timestamp"], y=price_df["price_usd"])
+        fig = go.Figure(trace)
     fig.update_layout(
         title=title,
         xaxis_title="Time",
@@ -86,19 +139,29 @@ def bubble_tvl_vs_volume(
     n: int = 25,
     title: str = "TVL vs 24‑Hour Volume",
 ):
-    """Return a bubble chart: X = TVL, Y = 24‑H volume, bubble = % price change."""
-    sel = (
-        df.sort_values("tvl_usd", ascending=False)
-        .head(n)
-        .copy()
+    """Return a bubble chart: X = TVL, Y = 24‑H volume, bubble = % price change.
+
+    Both axes are log10‑transformed here rather than by Plotly.js, and
+    labelled with decade ticks so the chart reads like a log‑log plot.
+    """
+    sel = df.nlargest(n, "tvl_usd")
+    sel = sel.assign(
+        log_tvl=np.log10(sel["tvl_usd"].clip(lower=1)),
+        log_vol=np.log10(sel["volume_usd_24h"].clip(lower=1)),
     )
     fig = px.scatter(
         sel,
-        x="tvl_usd",
-        y="volume_usd_24h",
+        x="log_tvl",
+        y="log_vol",
         size="price_change_pct_24h",
         color="price_change_pct_24h",
         hover_name="pair",
+        hover_data={
+            "log_tvl": False,
+            "log_vol": False,
+            "tvl_usd": ":,.0f",
+            "volume_usd_24h": ":,.0f",
+        },
         labels={
             "tvl_usd": "Total Value Locked (USD)",
             "volume_usd_24h": "24‑Hour Volume (USD)",
@@ -106,8 +169,22 @@ def bubble_tvl_vs_volume(
         },
         title=title,
         size_max=40,
+        render_mode="webgl",
+    )
+    x_ticks, x_labels = _log_ticks(sel["log_tvl"])
+    y_ticks, y_labels = _log_ticks(sel["log_vol"])
+    fig.update_layout(
+        xaxis={
+            "title": "Total Value Locked (USD)",
+            "tickvals": x_ticks,
+            "ticktext": x_labels,
+        },
+        yaxis={
+            "title": "24‑Hour Volume (USD)",
+            "tickvals": y_ticks,
+            "ticktext": y_labels,
+        },
     )
-    fig.update_layout(xaxis_type="log", yaxis_type="log")
     return fig
 
 # -----------------------------------------------------------------------------
@@ -9,12 +9,18 @@ These tests mock network calls so they work fully offline.
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import importlib.util
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import pytest
+from urllib3.exceptions import ProtocolError
 
+import scripts.cache as cache
 import scripts.fetch_data as fetch_data
 import scripts.analyzer as analyzer
 import scripts.visualizer as visualizer
@@ -39,7 +45,7 @@ sample_pool = {
 }
 
 
-def _fake_request(url: str, params: dict | None = None, timeout: int = 10):  # noqa: D401
+def _fake_request(url: str, params: dict | None = None, timeout: int = 10, **_):  # noqa: D401
     """Return deterministic fake payload – replaces fetch_data._request."""
 
     # GeckoTerminal pools endpoint normally returns {"data": [ ... ]}
@@ -61,6 +67,111 @@ def test_get_pools_returns_list():
     assert pools[0]["id"] == "eth0x123"
 
 
+def test_get_pools_paged_concatenates_pages():
+    """get_pools_paged should merge pages in order and trim to *total*."""
+
+    def fake_page(endpoint: str, params: dict | None = None, **_):
+        page = params["page[number]"]
+        size = params["page[size]"]
+        return {"data": [{"id": f"p{page}_{i}"} for i in range(size)]}
+
+    with patch("scripts.fetch_data._request", side_effect=fake_page):
+        pools = fetch_data.get_pools_paged("ethereum", total=5, page_size=2)
+
+    assert [p["id"] for p in pools] == ["p1_0", "p1_1", "p2_0", "p2_1", "p3_0"]
+
+
+def test_file_cache_roundtrip_and_ttl(tmp_path):
+    """FileCache returns fresh payloads and ignores expired ones."""
+
+    store = cache.FileCache(root=tmp_path, ttl=60)
+    params = {"page[number]": 1, "page[size]": 10}
+    assert store.get("networks/ethereum/pools", params) is None
+
+    store.set("networks/ethereum/pools", params, {"data": [sample_pool]})
+    assert store.get("networks/ethereum/pools", params) == {"data": [sample_pool]}
+
+    store.ttl = -1
+    assert store.get("networks/ethereum/pools", params) is None
+
+
+def test_file_cache_concurrent_writers(tmp_path):
+    """Concurrent sets of one key leave a valid file and no temp files."""
+
+    store = cache.FileCache(root=tmp_path)
+    payloads = [
+        {"data": [{"id": str(i)} for i in range(200)], "n": n} for n in range(16)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda p: store.set("networks/ethereum/pools", {}, p), payloads))
+
+    assert store.get("networks/ethereum/pools", {}) in payloads
+    assert not list(tmp_path.glob("*.tmp"))
+
+    (tmp_path / "stale.tmp").write_text("{")
+    store.clear()
+    assert not list(tmp_path.iterdir())
+
+
+def test_request_skips_network_on_cache_hit(tmp_path):
+    """fetch_data._request should not hit the HTTP session when cached."""
+
+    store = cache.FileCache(root=tmp_path)
+    store.set("pools/eth0x123", {}, {"data": sample_pool})
+
+    with patch.object(fetch_data, "_CACHE", store), \
+            patch.object(fetch_data._SESSION, "get") as mock_get:
+        data = fetch_data._request("pools/eth0x123")
+
+    mock_get.assert_not_called()
+    assert data["data"]["id"] == "eth0x123"
+
+
+def test_request_decodes_body_and_wraps_bad_json(tmp_path):
+    """_request parses raw bytes and reports malformed JSON as RuntimeError."""
+
+    store = cache.FileCache(root=tmp_path)
+    ok, bad = MagicMock(content=b'{"data": []}'), MagicMock(content=b"<html>")
+
+    with patch.object(fetch_data, "_CACHE", store), \
+            patch.object(fetch_data._SESSION, "get", side_effect=[ok, bad]):
+        assert fetch_data._request("networks/ethereum/pools") == {"data": []}
+        with pytest.raises(RuntimeError):
+            fetch_data._request("networks/bsc/pools")
+
+
+@pytest.mark.skipif(fetch_data.ijson is None, reason="ijson not installed")
+def test_request_streams_list_items(tmp_path):
+    """stream=True parses the ``data`` array incrementally from the raw body."""
+
+    store = cache.FileCache(root=tmp_path)
+    response = MagicMock(raw=io.BytesIO(b'{"data": [{"id": "a"}, {"id": "b"}]}'))
+    response.__enter__.return_value = response
+
+    with patch.object(fetch_data, "_CACHE", store), \
+            patch.object(fetch_data._SESSION, "get", return_value=response):
+        data = fetch_data._request("networks/ethereum/pools", stream=True)
+
+    assert data == {"data": [{"id": "a"}, {"id": "b"}]}
+    assert store.get("networks/ethereum/pools", {}) == data
+
+
+@pytest.mark.skipif(fetch_data.ijson is None, reason="ijson not installed")
+def test_request_stream_wraps_transport_errors(tmp_path):
+    """urllib3 errors raised while streaming the body become RuntimeError."""
+
+    store = cache.FileCache(root=tmp_path)
+    raw = MagicMock()
+    raw.read.side_effect = ProtocolError("Connection reset by peer")
+    response = MagicMock(raw=raw)
+    response.__enter__.return_value = response
+
+    with patch.object(fetch_data, "_CACHE", store), \
+            patch.object(fetch_data._SESSION, "get", return_value=response):
+        with pytest.raises(RuntimeError, match="API request failed"):
+            fetch_data._request("networks/ethereum/pools", stream=True)
+
+
 def test_pools_to_dataframe_columns():
     """DataFrame conversion keeps curated columns intact."""
 
@@ -76,6 +187,39 @@ def test_pools_to_dataframe_columns():
     assert expected.issubset(df.columns)
 
 
+def test_pools_to_dataframe_vectorized_fields():
+    """Nested attributes are flattened, renamed and cast column-wise."""
+
+    pool = {
+        "id": "eth0x456",
+        "attributes": {
+            "token_a_symbol": "WETH",
+            "token_b_symbol": "USDC",
+            "reserve_usd": "250000.5",
+            "volume_usd_24h": "not-a-number",
+        },
+    }
+    df = fetch_data.pools_to_dataframe([pool])
+
+    assert df.loc[0, "pair"] == "WETH/USDC"
+    assert df.loc[0, "tvl_usd"] == pytest.approx(250000.5)
+    assert pd.isna(df.loc[0, "volume_usd_24h"])
+    assert df["tvl_usd"].dtype == "float[pyarrow]"
+    assert isinstance(df["pair"].dtype, pd.CategoricalDtype)
+
+
+def test_pools_to_dataframe_pair_handles_missing_symbols():
+    """Missing token symbols are shown as '?' in the pair label."""
+
+    pools = [
+        {"id": "a", "attributes": {"token_a_symbol": "WETH"}},
+        {"id": "b", "attributes": {}},
+    ]
+    df = fetch_data.pools_to_dataframe(pools)
+
+    assert df["pair"].tolist() == ["WETH/?", "?/?"]
+
+
 def test_clean_numeric_converts_types():
     """analyzer.clean_numeric should convert object → float."""
 
@@ -92,9 +236,144 @@ def test_clean_numeric_converts_types():
     assert cleaned["tvl_usd"].dtype.kind in "fc"  # float or complex (rare)
 
 
+def test_clean_numeric_downcasts_without_mutating():
+    """clean_numeric returns Arrow float32 columns on a copy of the input."""
+
+    df = pd.DataFrame({"tvl_usd": ["100", "2.5", None]})
+    cleaned = analyzer.clean_numeric(df, ["tvl_usd"])
+
+    assert cleaned["tvl_usd"].dtype == "float[pyarrow]"
+    assert df["tvl_usd"].dtype.kind != "f"
+
+
+def test_clean_numeric_skips_numeric_columns():
+    """Already‑numeric columns are left as they are."""
+
+    df = pd.DataFrame({"tvl_usd": [1.0, 2.0], "volume_usd_24h": ["3", "x"]})
+    with patch("scripts.analyzer.pd.to_numeric", wraps=pd.to_numeric) as spy:
+        cleaned = analyzer.clean_numeric(df, ["tvl_usd", "volume_usd_24h"])
+
+    assert spy.call_count == 1
+    assert cleaned["tvl_usd"].dtype == "float64"
+    assert pd.isna(cleaned.loc[1, "volume_usd_24h"])
+
+
+def test_top_pools_by_volume_ranks_descending():
+    """analyzer.top_pools_by_volume keeps the N largest volumes in order."""
+
+    df = pd.DataFrame({"pair": list("abcde"), "volume_usd_24h": [3, 9, 1, 7, 5]})
+    top = analyzer.top_pools_by_volume(df, n=3)
+
+    assert top["pair"].tolist() == ["b", "d", "e"]
+    assert top.index.tolist() == [0, 1, 2]
+
+
+def test_volatility_matches_pandas_rolling_std():
+    """analyzer.volatility agrees with pandas' rolling sample std."""
+
+    prices = pd.Series(np.linspace(1.0, 2.0, 50) ** 2, name="price_usd")
+    prices[10] = np.nan
+    result = analyzer.volatility(prices, window=5)
+    expected = prices.rolling(window=5).std()
+
+    assert result.name == "price_usd"
+    pd.testing.assert_series_equal(result, expected, check_exact=False)
+
+
+def test_volatility_short_series_is_all_nan():
+    """A series shorter than the window yields NaNs instead of raising."""
+
+    prices = pd.Series([1.0, 2.0, 3.0])
+    result = analyzer.volatility(prices)
+
+    assert len(result) == 3
+    assert result.isna().all()
+
+
 def test_bar_chart_returns_figure():
     """visualizer.bar_top_volume should produce a Plotly Figure."""
 
     df = fetch_data.pools_to_dataframe([sample_pool])
     fig = visualizer.bar_top_volume(df, n=1)
     assert isinstance(fig, go.Figure)
+
+
+def test_bar_chart_orders_top_pools():
+    """bar_top_volume plots a single Bar trace, largest volume first."""
+
+    df = pd.DataFrame(
+        {
+            "pair": ["A/B", "C/D", "E/F"],
+            "volume_usd_24h": [10.0, 30.0, 20.0],
+            "tvl_usd": [1.0, 2.0, 3.0],
+        }
+    )
+    fig = visualizer.bar_top_volume(df, n=2)
+
+    assert len(fig.data) == 1 and fig.data[0].type == "bar"
+    assert list(fig.data[0].x) == ["C/D", "E/F"]
+    assert list(fig.data[0].text) == [2.0, 3.0]
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("plotly_resampler") is None,
+    reason="plotly-resampler not installed",
+)
+def test_line_price_trend_downsamples_long_series():
+    """Long price histories are resampled down to the visible sample budget."""
+
+    n = visualizer.RESAMPLE_THRESHOLD * 10
+    price_df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=n, freq="min"),
+            "price_usd": np.linspace(1.0, 2.0, n),
+        }
+    )
+    fig = visualizer.line_price_trend(price_df, token_symbol="eth")
+
+    assert isinstance(fig, go.Figure)
+    assert len(fig.data[0].x) <= visualizer.RESAMPLE_THRESHOLD
+
+
+def test_bubble_chart_uses_webgl():
+    """visualizer.bubble_tvl_vs_volume should render through WebGL."""
+
+    df = pd.DataFrame(
+        {
+            "pair": ["AAA/BBB"],
+            "tvl_usd": [100000.0],
+            "volume_usd_24h": [50000.0],
+            "price_change_pct_24h": [2.3],
+        }
+    )
+    fig = visualizer.bubble_tvl_vs_volume(df, n=1)
+    assert fig.data[0].type == "scattergl"
+
+
+def test_bubble_chart_precomputes_log_axes():
+    """Bubble chart ships log10 values with readable decade tick labels."""
+
+    df = pd.DataFrame(
+        {
+            "pair": ["AAA/BBB", "CCC/DDD"],
+            "tvl_usd": [1e5, 3e7],
+            "volume_usd_24h": [5e3, 2e6],
+            "price_change_pct_24h": [2.3, 4.1],
+        }
+    )
+    fig = visualizer.bubble_tvl_vs_volume(df, n=2)
+
+    assert fig.layout.xaxis.type is None  # linear – no client‑side log
+    assert list(fig.data[0].x) == pytest.approx([np.log10(3e7), 5.0])
+    assert fig.layout.xaxis.ticktext == ("100K", "1M", "10M", "100M")
+
+    # Values inside a single decade still get at least two in-range labels
+    narrow = df.assign(tvl_usd=[2e5, 8e5])
+    xaxis = visualizer.bubble_tvl_vs_volume(narrow, n=2).layout.xaxis
+    lo, hi = np.log10(2e5), np.log10(8e5)
+    inside = [
+        text
+        for val, text in zip(xaxis.tickvals, xaxis.ticktext)
+        if lo - 1e-9 <= val <= hi + 1e-9
+    ]
+    assert inside == ["200K", "500K"]